@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 import os
+import csv
+import io
 import jaydebeapi
 import psycopg2
-from psycopg2.extras import execute_values
+from psycopg2 import sql
+from psycopg2.extras import execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 import logging
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 import hashlib
 import json
@@ -12,10 +20,58 @@ import argparse
 from typing import Dict, Any, List, Optional
 from authentication import Config
 
+def _isoformat_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def _bytea_value(value):
+    # PG's bytea input function understands the \x hex form, both via
+    # COPY and as a plain literal
+    return "\\x" + bytes(value).hex()
+
+# java.sql.Types codes -> PostgreSQL column types; anything unlisted
+# (CHAR/VARCHAR/CLOB/unknown) stays TEXT, the safest representation
+_JDBC_TO_PG = {
+    -7: "BOOLEAN",          # BIT
+    16: "BOOLEAN",
+    -6: "SMALLINT",         # TINYINT
+    5: "SMALLINT",
+    4: "INTEGER",
+    -5: "BIGINT",
+    6: "DOUBLE PRECISION",  # FLOAT
+    7: "REAL",
+    8: "DOUBLE PRECISION",
+    2: "NUMERIC",
+    3: "NUMERIC",           # DECIMAL
+    91: "DATE",
+    92: "TIME",
+    93: "TIMESTAMP",
+    -2: "BYTEA",            # BINARY
+    -3: "BYTEA",            # VARBINARY
+    -4: "BYTEA",            # LONGVARBINARY
+    2004: "BYTEA",          # BLOB
+}
+
+# column converter dispatch keyed on the jaydebeapi type singletons;
+# None means the value is already a Python str and needs no call at all,
+# anything unlisted falls back to str
+_CONVERTER_MAP = {
+    jaydebeapi.DATE: _isoformat_value,
+    jaydebeapi.TIME: _isoformat_value,
+    jaydebeapi.DATETIME: _isoformat_value,
+    jaydebeapi.STRING: None,
+    jaydebeapi.TEXT: None,
+    jaydebeapi.BINARY: _bytea_value,
+}
+
 class SyncState:
     def __init__(self, pg_conn):
         self.pg_conn = pg_conn
         self.logger = logging.getLogger("data_import")
+        # the state table shares one connection across worker threads
+        self._lock = threading.Lock()
+        # per-run cache: each table's state is read by get_sync_strategy
+        # and again by the key-based sync, one round trip is enough
+        self._cache = {}
         self._ensure_state_table()
         
     def _ensure_state_table(self):
@@ -39,6 +95,12 @@ class SyncState:
             cursor.close()
     
     def get_last_sync(self, table_name: str) -> Dict[str, Any]:
+        with self._lock:
+            if table_name not in self._cache:
+                self._cache[table_name] = self._get_last_sync(table_name)
+            return self._cache[table_name]
+
+    def _get_last_sync(self, table_name: str) -> Dict[str, Any]:
         cursor = self.pg_conn.cursor()
         try:
             cursor.execute("""
@@ -61,8 +123,14 @@ class SyncState:
         finally:
             cursor.close()
     
-    def update_sync_state(self, table_name: str, last_key_value: str = None, 
+    def update_sync_state(self, table_name: str, last_key_value: str = None,
                           sync_method: str = 'timestamp', row_count: int = 0):
+        with self._lock:
+            self._update_sync_state(table_name, last_key_value, sync_method, row_count)
+            self._cache.pop(table_name, None)
+
+    def _update_sync_state(self, table_name: str, last_key_value: str = None,
+                           sync_method: str = 'timestamp', row_count: int = 0):
         cursor = self.pg_conn.cursor()
         try:
             cursor.execute("""
@@ -77,7 +145,10 @@ class SyncState:
                 row_count = EXCLUDED.row_count
             """, (table_name, last_key_value, sync_method, row_count))
             self.pg_conn.commit()
-            self.logger.info(f"Updated sync state for {table_name}, key: {last_key_value}, rows: {row_count}")
+            # debug, not info: per-batch checkpointing would otherwise
+            # put a formatted write + flush back on the hot path
+            self.logger.debug("Updated sync state for %s, key: %s, rows: %d",
+                         table_name, last_key_value, row_count)
         except Exception as e:
             self.pg_conn.rollback()
             self.logger.error(f"Error updating sync state for {table_name}: {e}")
@@ -85,17 +156,36 @@ class SyncState:
             cursor.close()
 
 class DataSyncManager:
-    def __init__(self, full_sync: bool = False, ignore_tables: list = None):
+    def __init__(self, full_sync: bool = False, ignore_tables: list = None,
+                 verify_counts: bool = False, only_tables: set = None):
         self.config = Config()
         self.full_sync = full_sync
+        self.verify_counts = verify_counts
+        self.only_tables = only_tables
         self.batch_size = self.config.mirror_settings["batch_size"]
+        self.max_workers = self.config.mirror_settings.get("max_workers", 1)
+        # how many committed batches between sync_state checkpoints in
+        # key-based sync; 1 = after every batch (cheapest possible replay)
+        self.checkpoint_every = self.config.mirror_settings.get("checkpoint_every_batches", 1)
+        # interim commits during a full reload; 0 keeps the whole table
+        # in one transaction (one WAL flush, old data intact on failure),
+        # >0 trades that atomicity for shorter transactions on huge tables
+        self.commit_every = self.config.mirror_settings.get("commit_every_batches", 0)
+        # per-batch progress lines hit the file handler (and its flush)
+        # every time; emit one line every N batches instead
+        self.log_every = self.config.mirror_settings.get("log_every_n_batches", 10)
         self.setup_logging()
-        
+
         progress_config = self.config.progress_db
         jdbc_url = f"jdbc:datadirect:openedge://{progress_config['host']}:{progress_config['port']};databaseName={progress_config['db_name']}"
         self.oe_conn = None
-        self.pg_conn = None
+        # each worker thread checks out its own PG connection so commits
+        # from concurrent table syncs never interleave
+        self.pg_pool = None
+        self._pg_local = threading.local()
         self.ignored_tables = set()
+        self._pending_ignores = []
+        self.source_row_estimates = {}
         self.load_ignore_list()
         if ignore_tables:
             self.add_to_ignore_list(ignore_tables)
@@ -106,6 +196,25 @@ class DataSyncManager:
             "start_time": time.time()
         }
 
+    @property
+    def pg_conn(self):
+        return getattr(self._pg_local, "conn", None)
+
+    @pg_conn.setter
+    def pg_conn(self, conn):
+        self._pg_local.conn = conn
+
+    def _checkout_pg_conn(self):
+        conn = self.pg_pool.getconn()
+        self.pg_conn = conn
+        return conn
+
+    def _release_pg_conn(self):
+        conn = self.pg_conn
+        if conn is not None:
+            self.pg_conn = None
+            self.pg_pool.putconn(conn)
+
     def setup_logging(self):
         logging.basicConfig(
             level=logging.INFO,
@@ -128,15 +237,43 @@ class DataSyncManager:
             self.logger.error(f"Error loading ignore file {ignore_file}: {e}")
 
     def add_to_ignore_list(self, tables: list):
+        # mutate the in-memory set only; the file is appended once at
+        # the end of the run instead of reopened on every failure
+        added = []
+        for table in tables:
+            table = table.strip().lower()
+            if table not in self.ignored_tables:
+                self.ignored_tables.add(table)
+                self._pending_ignores.append(table)
+                added.append(table)
+        if added:
+            self.logger.info(f"Added tables to ignore list: {added}")
+
+    def _ignore_if_permission_error(self, table_name: str, exc: Exception):
+        # unreadable tables used to be auto-ignored when the per-table
+        # column probe failed; discovery is metadata-only now, so catch
+        # the actual SELECT being denied here and ignore the table on
+        # future runs instead of erroring forever. Only source-side
+        # errors qualify: a PG-side permission problem (e.g. TRUNCATE on
+        # a table we don't own) is a target misconfiguration that should
+        # keep erroring visibly, not silently stop the mirror
+        if isinstance(exc, psycopg2.Error):
+            return
+        message = str(exc).lower()
+        if "permission denied" in message or "access denied" in message \
+                or "not authorized" in message:
+            self.logger.warning(f"No read permission on {table_name}, adding to ignore list")
+            self.add_to_ignore_list([table_name])
+
+    def flush_ignore_list(self):
+        if not self._pending_ignores:
+            return
         ignore_file = self.config.mirror_settings.get("ignore_file", "ignored_tables.txt")
         try:
             with open(ignore_file, "a") as f:
-                for table in tables:
-                    table = table.strip().lower()
-                    if table not in self.ignored_tables:
-                        f.write(f"{table}\n")
-                        self.ignored_tables.add(table)
-            self.logger.info(f"Added tables to ignore list: {tables}")
+                f.writelines(f"{table}\n" for table in self._pending_ignores)
+            self.logger.info(f"Flushed {len(self._pending_ignores)} new entries to {ignore_file}")
+            self._pending_ignores = []
         except Exception as e:
             self.logger.error(f"Error adding tables to ignore file: {e}")
 
@@ -151,11 +288,20 @@ class DataSyncManager:
                 progress_config["jar_file"]
             )
             self.logger.info("Connected to OpenEdge database")
+
+            try:
+                # server-side cursors need autocommit off, otherwise the
+                # driver is free to buffer entire result sets in the JVM
+                self.oe_conn.jconn.setAutoCommit(False)
+            except Exception as e:
+                self.logger.warning(f"Could not disable autocommit on OpenEdge connection: {e}")
             
-            self.pg_conn = psycopg2.connect(
+            self.pg_pool = ThreadedConnectionPool(
+                1, max(2, self.max_workers + 1),
                 self.config.postgres_db["conn_string"],
                 connect_timeout=self.config.postgres_db.get("timeout", 30)
             )
+            self._checkout_pg_conn()
             self.logger.info("Connected to PostgreSQL database")
             
             cursor = self.pg_conn.cursor()
@@ -180,13 +326,14 @@ class DataSyncManager:
                 pass
             self.oe_conn = None
             
-        if self.pg_conn:
+        if self.pg_pool:
             try:
-                self.pg_conn.close()
-                self.logger.info("Closed PostgreSQL connection")
+                self.pg_pool.closeall()
+                self.logger.info("Closed PostgreSQL connection pool")
             except:
                 pass
-            self.pg_conn = None
+            self.pg_pool = None
+        self._pg_local = threading.local()
 
     def get_source_tables(self):
         if not self.oe_conn:
@@ -194,45 +341,93 @@ class DataSyncManager:
             return []
             
         tables = []
-        cursor = None
-        
+
         try:
-            cursor = self.oe_conn.cursor()
             metadata = self.oe_conn.jconn.getMetaData()
+
+            # one getColumns call covers the whole schema; probing each
+            # table with SELECT * WHERE 1=0 was a round-trip per table
+            columns_by_table = {}
+            col_result_set = metadata.getColumns(None, "PUB", None, None)
+            while col_result_set.next():
+                col_table = col_result_set.getString("TABLE_NAME").lower()
+                col_name = col_result_set.getString("COLUMN_NAME").strip().lower()
+                pg_type = _JDBC_TO_PG.get(int(col_result_set.getInt("DATA_TYPE")), "TEXT")
+                columns_by_table.setdefault(col_table, []).append((col_name, pg_type))
+            col_result_set.close()
+
+            # one getPrimaryKeys call for the whole schema when the
+            # driver accepts a null table name; fall back to per-table
+            # lookups if this DataDirect build insists on one
+            pk_by_table = {}
+            pks_batched = True
+            try:
+                pk_result_set = metadata.getPrimaryKeys(None, "PUB", None)
+                while pk_result_set.next():
+                    pk_table = pk_result_set.getString("TABLE_NAME").lower()
+                    pk_by_table.setdefault(pk_table, pk_result_set.getString("COLUMN_NAME").lower())
+                pk_result_set.close()
+            except Exception as e:
+                pks_batched = False
+                self.logger.warning(f"Batched primary key lookup not supported, "
+                               f"falling back to per-table calls: {e}")
+
             result_set = metadata.getTables(None, "PUB", None, ["TABLE"])
-            
+
             while result_set.next():
                 table_name = result_set.getString("TABLE_NAME").lower()
-                
+
                 if table_name.startswith("_") or table_name in self.ignored_tables:
                     continue
-                
-                pk_result_set = metadata.getPrimaryKeys(None, "PUB", table_name)
-                pk_column = None
-                if pk_result_set.next():
-                    pk_column = pk_result_set.getString("COLUMN_NAME").lower()
-                pk_result_set.close()
-                
-                try:
-                    cursor.execute(f"SELECT * FROM PUB.{table_name} WHERE 1=0")
-                    columns = [desc[0].strip().lower() for desc in cursor.description]
-                    
-                    if columns:
-                        tables.append({
-                            "table_name": table_name, 
-                            "columns": columns,
-                            "pk_column": pk_column
-                        })
-                        self.logger.info(f"Found table {table_name} with {len(columns)} columns and PK: {pk_column}")
-                except Exception as e:
-                    self.logger.warning(f"Error getting schema for {table_name}: {e}")
-                    if "permission denied" in str(e).lower():
-                        self.add_to_ignore_list([table_name])
-            
+
+                if self.only_tables is not None and table_name not in self.only_tables:
+                    continue
+
+                if pks_batched:
+                    pk_column = pk_by_table.get(table_name)
+                else:
+                    pk_result_set = metadata.getPrimaryKeys(None, "PUB", table_name)
+                    pk_column = None
+                    if pk_result_set.next():
+                        pk_column = pk_result_set.getString("COLUMN_NAME").lower()
+                    pk_result_set.close()
+
+                column_entries = columns_by_table.get(table_name)
+                if column_entries:
+                    columns = [name for name, _ in column_entries]
+                    tables.append({
+                        "table_name": table_name,
+                        "columns": columns,
+                        "column_types": {name: pg_type for name, pg_type in column_entries},
+                        "pk_column": pk_column
+                    })
+                    self.logger.info(f"Found table {table_name} with {len(columns)} columns and PK: {pk_column}")
+                else:
+                    self.logger.warning(f"No column metadata for {table_name}, skipping")
+            result_set.close()
+
             return tables
         except Exception as e:
             self.logger.error(f"Error getting OpenEdge tables: {e}")
             return []
+
+    def load_source_row_estimates(self):
+        # one metaschema query replaces a COUNT(*) full scan per table;
+        # the estimates can lag reality so they only feed progress
+        # output, never correctness decisions
+        self.source_row_estimates = {}
+        if not self.oe_conn:
+            return
+        cursor = None
+        try:
+            cursor = self.oe_conn.cursor()
+            cursor.execute('SELECT "_File-Name", "_nb-recs" FROM PUB."_File"')
+            for row in cursor.fetchall():
+                if row[0] and row[1] is not None:
+                    self.source_row_estimates[str(row[0]).strip().lower()] = int(row[1])
+            self.logger.info(f"Loaded row estimates for {len(self.source_row_estimates)} tables")
+        except Exception as e:
+            self.logger.warning(f"Could not load row estimates from _File metaschema: {e}")
         finally:
             if cursor:
                 cursor.close()
@@ -256,57 +451,119 @@ class DataSyncManager:
             if cursor:
                 cursor.close()
 
+    def get_target_row_count_estimate(self, table_name: str) -> int:
+        # reltuples is a planner estimate and effectively free, unlike
+        # COUNT(*) which seq-scans; -1 means unknown or no such table
+        cursor = self.pg_conn.cursor()
+        try:
+            # quoted so hyphenated OpenEdge table names stay parseable,
+            # same as the ensure_target_table lookup
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                (f'analytics."{table_name}"',)
+            )
+            row = cursor.fetchone()
+            if row and row[0] is not None and row[0] >= 0:
+                return int(row[0])
+            return -1
+        except Exception as e:
+            self.pg_conn.rollback()
+            self.logger.warning(f"Could not estimate target row count for {table_name}: {e}")
+            return -1
+        finally:
+            cursor.close()
+
+    def _ensure_pk_index(self, cursor, table_info: Dict):
+        # ON CONFLICT needs a unique constraint; without one every
+        # UPSERT batch failed and fell into the expensive merge path.
+        # Record the outcome so sync_key_based decides once per table.
+        table_name = table_info["table_name"]
+        pk_column = table_info.get("pk_column")
+        table_info["has_pk_index"] = False
+        if not pk_column:
+            return
+        try:
+            cursor.execute(sql.SQL(
+                "CREATE UNIQUE INDEX IF NOT EXISTS {idx} ON {tbl} ({pk})"
+            ).format(
+                idx=sql.Identifier(f"ux_{table_name}_pk"),
+                tbl=sql.Identifier("analytics", table_name),
+                pk=sql.Identifier(pk_column)
+            ))
+            self.pg_conn.commit()
+            table_info["has_pk_index"] = True
+        except Exception as e:
+            # duplicate key values in already-mirrored data, most likely
+            self.pg_conn.rollback()
+            self.logger.warning(f"Could not create unique PK index on {table_name}: {e}; "
+                           "key-based sync will use the staging merge")
+
     def ensure_target_table(self, table_info: Dict):
         if not self.pg_conn:
             return False
             
         table_name = table_info["table_name"]
         columns = table_info["columns"]
+        # tables discovered before type mapping existed fall back to TEXT
+        column_types = table_info.get("column_types", {})
         cursor = None
-        
+
         try:
             cursor = self.pg_conn.cursor()
+            # one catalog query does double duty: no rows means the
+            # table does not exist, otherwise we get its columns.
+            # pg_attribute directly beats the information_schema view,
+            # which layers joins and permission filters over the same
+            # catalogs; to_regclass folds the existence check in by
+            # returning NULL for a missing table
             cursor.execute("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.tables 
-                WHERE table_schema = 'analytics' AND table_name = %s
-            )
-            """, (table_name,))
-            
-            table_exists = cursor.fetchone()[0]
-            
-            if not table_exists:
-                column_defs = [f'"{col}" TEXT' for col in columns]
-                create_query = f"""
-                CREATE TABLE analytics.{table_name} (
-                    {', '.join(column_defs)}
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = to_regclass(%s)
+              AND attnum > 0 AND NOT attisdropped
+            """, (f'analytics."{table_name}"',))
+
+            existing_columns = {row[0] for row in cursor.fetchall()}
+
+            if not existing_columns:
+                # column types come from our own _JDBC_TO_PG map, so they
+                # are safe to splice as raw SQL; names go through Identifier
+                column_defs = sql.SQL(", ").join(
+                    sql.SQL("{col} {ctype}").format(
+                        col=sql.Identifier(col),
+                        ctype=sql.SQL(column_types.get(col, "TEXT"))
+                    ) for col in columns
                 )
-                """
-                cursor.execute(create_query)
+                cursor.execute(sql.SQL("CREATE TABLE {tbl} ({defs})").format(
+                    tbl=sql.Identifier("analytics", table_name),
+                    defs=column_defs
+                ))
                 self.pg_conn.commit()
                 self.logger.info(f"Created table analytics.{table_name}")
+                self._ensure_pk_index(cursor, table_info)
                 return True
             else:
-                cursor.execute("""
-                SELECT column_name FROM information_schema.columns
-                WHERE table_schema = 'analytics' AND table_name = %s
-                """, (table_name,))
-                
-                existing_columns = {row[0] for row in cursor.fetchall()}
                 source_columns = {col.lower() for col in columns}
                 
                 missing_columns = source_columns - existing_columns
                 
                 if missing_columns:
-                    # Add missing columns
-                    for column in missing_columns:
-                        cursor.execute(f"""
-                        ALTER TABLE analytics.{table_name} ADD COLUMN "{column}" TEXT
-                        """)
-                    
+                    # one ALTER adds every missing column: a single
+                    # ACCESS EXCLUSIVE lock and catalog update instead
+                    # of one per column
+                    cursor.execute(sql.SQL("ALTER TABLE {tbl} {adds}").format(
+                        tbl=sql.Identifier("analytics", table_name),
+                        adds=sql.SQL(", ").join(
+                            sql.SQL("ADD COLUMN {col} {ctype}").format(
+                                col=sql.Identifier(column),
+                                ctype=sql.SQL(column_types.get(column, "TEXT"))
+                            ) for column in sorted(missing_columns)
+                        )
+                    ))
+
                     self.pg_conn.commit()
                     self.logger.info(f"Added {len(missing_columns)} columns to analytics.{table_name}")
-                
+
+                self._ensure_pk_index(cursor, table_info)
                 return True
         except Exception as e:
             self.pg_conn.rollback()
@@ -327,6 +584,16 @@ class DataSyncManager:
         last_sync = self.sync_state.get_last_sync(table_name)
         
         if not last_sync:
+            # No recorded state, but if source and target estimates
+            # already agree the table was mirrored by an earlier run and
+            # a full reload would be wasted work
+            source_estimate = self.source_row_estimates.get(table_name, 0)
+            if source_estimate > 0:
+                target_estimate = self.get_target_row_count_estimate(table_name)
+                if target_estimate >= 0 and abs(target_estimate - source_estimate) <= max(1, source_estimate // 100):
+                    self.logger.info(f"Target estimate for {table_name} matches source "
+                                f"({target_estimate} ~ {source_estimate}), skipping")
+                    return "skip"
             # First time sync - use full sync
             return "full"
             
@@ -337,6 +604,114 @@ class DataSyncManager:
         # Otherwise use timestamp-based sync
         return "timestamp"
 
+    def _build_converters(self, description) -> Optional[List]:
+        # Each column keeps one Python type for the whole result set, so
+        # look the conversion up once per column from the dispatch table
+        # instead of branching per cell; converters only ever see
+        # non-None values. None for the whole list means every column is
+        # pass-through (an all-character table, the common OpenEdge
+        # case) and callers can skip per-cell dispatch entirely
+        converters = [_CONVERTER_MAP.get(col_desc[1], str) for col_desc in description]
+        if all(conv is None for conv in converters):
+            return None
+        return converters
+
+    def _process_row(self, row, converters) -> List:
+        if converters is None:
+            return list(row)
+        return [value if value is None or conv is None else conv(value)
+                for conv, value in zip(converters, row)]
+
+    def _encode_batch(self, batch, converters) -> io.StringIO:
+        # rows are CSV-encoded straight off the JDBC batch so we never
+        # build an intermediate list-of-lists; the buffer is returned
+        # positioned at its end (tell() gives the encoded size).
+        # writerows keeps the row loop inside the C csv module, and the
+        # pass-through branch drops the per-cell converter dispatch —
+        # this loop is the dominant CPU cost of a full sync, so it runs
+        # as close to C as the stdlib allows
+        buf = io.StringIO()
+        writer = csv.writer(buf, quoting=csv.QUOTE_MINIMAL)
+        if converters is None:
+            writer.writerows(
+                ["\\N" if value is None else value for value in row]
+                for row in batch)
+        else:
+            writer.writerows(
+                ["\\N" if value is None
+                 else value if conv is None
+                 else conv(value)
+                 for conv, value in zip(converters, row)]
+                for row in batch)
+        return buf
+
+    def _copy_batch(self, pg_cursor, copy_query, batch, converters):
+        # COPY sends the whole batch in one round trip instead of one
+        # INSERT per row
+        buf = self._encode_batch(batch, converters)
+        batch_bytes = buf.tell()
+        buf.seek(0)
+        pg_cursor.copy_expert(copy_query, buf)
+        return batch_bytes
+
+    def _tune_oe_cursor(self, oe_cursor):
+        # matching arraysize to the batch keeps jaydebeapi pulling rows
+        # across the Python/Java boundary in bulk, and setFetchSize asks
+        # the driver to stream from the server in batch-sized chunks
+        # instead of materializing the whole result set
+        oe_cursor.arraysize = self.batch_size
+        try:
+            oe_cursor._rs.setFetchSize(self.batch_size)
+        except Exception as e:
+            self.logger.warning(f"Could not set JDBC fetch size: {e}")
+
+    def _drop_indexes_for_load(self, pg_cursor, table_name: str) -> List[str]:
+        # maintaining indexes row-by-row during a bulk load is far
+        # slower than one rebuild at the end; save the definitions so
+        # they can be recreated afterwards. Indexes backing PRIMARY
+        # KEY/UNIQUE constraints must stay: DROP INDEX on those raises
+        # and would abort the reload transaction, and pg_indexes cannot
+        # tell them apart, so go through pg_index/pg_constraint
+        pg_cursor.execute("""
+        SELECT ci.relname, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        JOIN pg_class ci ON ci.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass(%s)
+          AND NOT i.indisprimary
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint con WHERE con.conindid = i.indexrelid
+          )
+        """, (f'analytics."{table_name}"',))
+        index_defs = []
+        for index_name, index_def in pg_cursor.fetchall():
+            pg_cursor.execute(sql.SQL("DROP INDEX {idx}").format(
+                idx=sql.Identifier("analytics", index_name)))
+            index_defs.append(index_def)
+        return index_defs
+
+    def _rebuild_indexes(self, table_name: str, index_defs: List[str]):
+        if not index_defs:
+            return
+        cursor = self.pg_conn.cursor()
+        try:
+            # clear any aborted transaction left by a failed load so the
+            # rebuild always runs
+            self.pg_conn.rollback()
+            cursor.execute("SET LOCAL maintenance_work_mem = '512MB'")
+            for index_def in index_defs:
+                # a rolled-back load never dropped the indexes, so
+                # tolerate ones that still exist
+                cursor.execute(index_def
+                               .replace("CREATE UNIQUE INDEX", "CREATE UNIQUE INDEX IF NOT EXISTS", 1)
+                               .replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1))
+            self.pg_conn.commit()
+            self.logger.info(f"Rebuilt {len(index_defs)} index(es) on analytics.{table_name}")
+        except Exception as e:
+            self.pg_conn.rollback()
+            self.logger.error(f"Error rebuilding indexes on {table_name}: {e}")
+        finally:
+            cursor.close()
+
     def sync_full_table(self, table_info: Dict) -> int:
         if not self.oe_conn or not self.pg_conn:
             return 0
@@ -344,59 +719,151 @@ class DataSyncManager:
         table_name = table_info["table_name"]
         columns = table_info["columns"]
         pk_column = table_info.get("pk_column")
-        
-        total_rows = self.get_source_row_count(table_name)
-        
+
+        # COUNT(*) is a full scan on OpenEdge and only feeds the
+        # progress percentage, so it is opt-in via --verify-counts;
+        # otherwise fall back to the metaschema estimate if we have one
+        if self.verify_counts:
+            total_rows = self.get_source_row_count(table_name)
+        else:
+            total_rows = self.source_row_estimates.get(table_name, 0)
+
         oe_cursor = None
         pg_cursor = None
-        
+        index_defs = []
+        fetch_thread = None
+        batch_queue = None
+        stop_fetch = threading.Event()
+
         try:
+            # the whole reload is one transaction: truncate, load, then a
+            # single commit, so WAL is fsynced once per table instead of
+            # once per batch and a failed load leaves the old data intact
             pg_cursor = self.pg_conn.cursor()
-            pg_cursor.execute(f"TRUNCATE TABLE analytics.{table_name}")
-            self.pg_conn.commit()
+            # the reload is atomic anyway, so there is nothing to gain
+            # from waiting on the WAL flush at commit; worst case after
+            # a crash is rerunning the table
+            pg_cursor.execute("SET LOCAL synchronous_commit = off")
+            # composed once per table; Identifier handles quoting of
+            # mixed-case/reserved-word names the f-strings used to miss
+            target = sql.Identifier("analytics", table_name)
+            pg_cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+            pg_cursor.execute(sql.SQL("TRUNCATE TABLE {tbl}").format(tbl=target))
+            # deferring index maintenance only pays off past a certain
+            # size; on small tables the rebuild costs more than keeping
+            # the indexes live. 0 means no estimate, so assume big
+            if total_rows == 0 or total_rows >= 50_000:
+                index_defs = self._drop_indexes_for_load(pg_cursor, table_name)
             oe_cursor = self.oe_conn.cursor()
-            oe_cursor.execute(f"SELECT {', '.join(f'\"{col}\"' for col in columns)} FROM PUB.{table_name}")
+            col_list = ", ".join(f'"{col}"' for col in columns)
+            oe_cursor.execute(f"SELECT {col_list} FROM PUB.{table_name}")
+            self._tune_oe_cursor(oe_cursor)
+            converters = self._build_converters(oe_cursor.description)
             rows_synced = 0
+            batch_count = 0
             last_value = None
-            
+            pk_index = columns.index(pk_column) if pk_column else None
+
+            # build the per-table statements once and reuse them for
+            # every batch instead of re-assembling SQL in the loop
+            copy_query = sql.SQL(
+                "COPY {tbl} ({cols}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+            ).format(tbl=target, cols=pg_cols)
+            insert_query = sql.SQL(
+                "INSERT INTO {tbl} ({cols}) VALUES %s"
+            ).format(tbl=target, cols=pg_cols)
+            # precomputed template saves execute_values re-deriving the
+            # row shape for every batch
+            values_template = "(" + ",".join(["%s"] * len(columns)) + ")"
+
+            # bounded queue keeps the JDBC fetch running while psycopg2
+            # is busy with COPY, so the two latencies overlap instead of
+            # adding up; depth 2 caps memory at ~2 batches
+            batch_queue = queue.Queue(maxsize=2)
+            fetch_errors = []
+            # one fixed batch_size under-batches narrow tables and
+            # memory-spikes wide ones; after measuring the first batch
+            # the writer retunes this toward ~64 MB per batch
+            adaptive = {"rows": self.batch_size}
+
+            def fetch_batches():
+                # CSV-encode in the fetch thread too, so JDBC decoding
+                # and encoding overlap the COPY on the writer side
+                try:
+                    while not stop_fetch.is_set():
+                        fetched = oe_cursor.fetchmany(adaptive["rows"])
+                        if not fetched:
+                            break
+                        batch_queue.put((fetched, self._encode_batch(fetched, converters)))
+                except Exception as fetch_exc:
+                    fetch_errors.append(fetch_exc)
+                finally:
+                    batch_queue.put(None)
+
+            fetch_thread = threading.Thread(target=fetch_batches, daemon=True)
+            fetch_thread.start()
+
             while True:
-                batch = oe_cursor.fetchmany(self.batch_size)
-                if not batch:
+                item = batch_queue.get()
+                if item is None:
                     break
-                    
-                batch_rows = []
-                for row in batch:
-                    if pk_column:
-                        pk_index = columns.index(pk_column)
+                batch, buf = item
+
+                if pk_index is not None:
+                    for row in batch:
                         if row[pk_index] is not None:
                             last_value = str(row[pk_index])
-                    
-                    processed_row = []
-                    for value in row:
-                        if value is None:
-                            processed_row.append(None)
-                        elif hasattr(value, 'isoformat'):  # Date objects
-                            processed_row.append(value.isoformat())
-                        else:
-                            processed_row.append(str(value))
-                    
-                    batch_rows.append(processed_row)
-                
-                if batch_rows:
-                    insert_query = f"""
-                    INSERT INTO analytics.{table_name} 
-                    ({', '.join(f'"{col}"' for col in columns)})
-                    VALUES %s
-                    """
-                    execute_values(pg_cursor, insert_query, batch_rows)
+
+                try:
+                    pg_cursor.execute("SAVEPOINT copy_batch")
+                    batch_bytes = buf.tell()
+                    buf.seek(0)
+                    pg_cursor.copy_expert(copy_query, buf)
+                    pg_cursor.execute("RELEASE SAVEPOINT copy_batch")
+                    if rows_synced == 0 and batch_bytes > 0:
+                        avg_row_bytes = max(1, batch_bytes // len(batch))
+                        adaptive["rows"] = max(500, min(50_000, (64 * 1024 * 1024) // avg_row_bytes))
+                        if adaptive["rows"] != self.batch_size:
+                            self.logger.info(f"Tuned batch size for {table_name} to "
+                                        f"{adaptive['rows']} rows (~{avg_row_bytes} bytes/row)")
+                except Exception as e:
+                    # COPY can choke on rows with binary/bytea anomalies;
+                    # roll back just this batch and retry it as a plain
+                    # multi-row INSERT without aborting the transaction
+                    pg_cursor.execute("ROLLBACK TO SAVEPOINT copy_batch")
+                    self.logger.warning(f"COPY failed for {table_name}, falling back to INSERT: {e}")
+                    batch_rows = [self._process_row(row, converters) for row in batch]
+                    # default page_size of 100 would split the batch into
+                    # many sub-statements; send it as one VALUES list
+                    execute_values(pg_cursor, insert_query, batch_rows,
+                                   template=values_template, page_size=len(batch_rows))
+
+                rows_synced += len(batch)
+                batch_count += 1
+
+                if self.commit_every > 0 and batch_count % self.commit_every == 0:
                     self.pg_conn.commit()
-                    
-                    rows_synced += len(batch_rows)
-                    
-                    progress_pct = (rows_synced / total_rows * 100) if total_rows > 0 else 0
-                    self.logger.info(f"Inserted {len(batch_rows)} rows for {table_name} "
-                                f"(total: {rows_synced} of {total_rows} ({progress_pct:.1f}%))")
-            
+                    # SET LOCAL only lasts until commit, so re-apply it
+                    # for the next transaction
+                    pg_cursor.execute("SET LOCAL synchronous_commit = off")
+
+                # %-style args defer formatting to the handler, and the
+                # throttle keeps log I/O off the per-batch critical path
+                if self.log_every > 0 and batch_count % self.log_every == 0:
+                    if total_rows > 0:
+                        self.logger.info("Inserted %d rows for %s (total: %d of %d (%.1f%%))",
+                                    len(batch), table_name, rows_synced, total_rows,
+                                    rows_synced / total_rows * 100)
+                    else:
+                        self.logger.info("Inserted %d rows for %s (total: %d rows so far)",
+                                    len(batch), table_name, rows_synced)
+
+            fetch_thread.join()
+            if fetch_errors:
+                raise fetch_errors[0]
+
+            self.pg_conn.commit()
+
             if pk_column and last_value:
                 self.sync_state.update_sync_state(
                     table_name, 
@@ -416,8 +883,24 @@ class DataSyncManager:
         except Exception as e:
             self.pg_conn.rollback()
             self.logger.error(f"Error performing full sync of {table_name}: {e}")
+            self._ignore_if_permission_error(table_name, e)
             return 0
         finally:
+            if fetch_thread is not None and fetch_thread.is_alive():
+                # a writer-side failure leaves the producer blocked in
+                # put() on the full queue; signal it to stop and keep
+                # draining until it exits, so the JDBC cursor is never
+                # closed under a concurrent fetchmany and no thread (or
+                # its encoded batches) outlives this table
+                stop_fetch.set()
+                while fetch_thread.is_alive():
+                    try:
+                        batch_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                fetch_thread.join()
+            # restore indexes even if the load bailed out partway
+            self._rebuild_indexes(table_name, index_defs)
             if oe_cursor:
                 oe_cursor.close()
             if pg_cursor:
@@ -430,7 +913,8 @@ class DataSyncManager:
         table_name = table_info["table_name"]
         columns = table_info["columns"]
         pk_column = table_info.get("pk_column")
-        
+        has_pk_index = table_info.get("has_pk_index", False)
+
         if not pk_column:
             self.logger.warning(f"Table {table_name} has no primary key, falling back to full sync")
             return self.sync_full_table(table_info)
@@ -442,106 +926,144 @@ class DataSyncManager:
             self.logger.warning(f"No last key value for {table_name}, falling back to full sync")
             return self.sync_full_table(table_info)
         
-        total_new_rows = 0
-        try:
-            count_cursor = self.oe_conn.cursor()
-            count_cursor.execute(f"SELECT COUNT(*) FROM PUB.{table_name} WHERE \"{pk_column}\" > ?", (last_key_value,))
-            count_row = count_cursor.fetchone()
-            total_new_rows = count_row[0] if count_row else 0
-            count_cursor.close()
-            
-            self.logger.info(f"Found {total_new_rows} new/changed rows to sync for {table_name}")
-        except Exception as e:
-            self.logger.warning(f"Could not count new rows for {table_name}: {e}")
-        
         oe_cursor = None
         pg_cursor = None
-        
+        staging_created = False
+        prepared = False
+        # the statement name is hashed because OpenEdge table names can
+        # contain characters PREPARE identifiers cannot
+        prep_name = "p_upsert_" + hashlib.md5(table_name.encode()).hexdigest()[:12]
+
         try:
             oe_cursor = self.oe_conn.cursor()
             pg_cursor = self.pg_conn.cursor()
-            
-            query = f"""
-            SELECT {', '.join(f'\"{col}\"' for col in columns)} 
-            FROM PUB.{table_name} 
+
+            col_list = ", ".join(f'"{col}"' for col in columns)
+            # explicit keyset pagination: one bounded query per page
+            # instead of a single long-lived cursor, so memory stays
+            # capped even when the driver ignores setFetchSize, and the
+            # source holds no cursor state between pages
+            page_query = f"""
+            SELECT {col_list}
+            FROM PUB.{table_name}
             WHERE "{pk_column}" > ?
             ORDER BY "{pk_column}"
+            FETCH FIRST {self.batch_size} ROWS ONLY
             """
-            
-            oe_cursor.execute(query, (last_key_value,))
-            
+            converters = None
+
+            # the fallback merges each batch through a session-scoped
+            # staging table: COPY in, one indexed DELETE USING, one
+            # INSERT ... SELECT — set operations instead of an IN (list)
+            # that the planner re-plans every batch
+            target = sql.Identifier("analytics", table_name)
+            pg_cols = sql.SQL(", ").join(map(sql.Identifier, columns))
+            pk_ident = sql.Identifier(pk_column)
+            staging_table = f"stg_{table_name}"
+            staging = sql.Identifier(staging_table)
+            staging_copy_query = sql.SQL(
+                "COPY {stg} ({cols}) FROM STDIN WITH (FORMAT CSV, NULL '\\N')"
+            ).format(stg=staging, cols=pg_cols)
+
             rows_synced = 0
+            batch_count = 0
+            prior_rows = last_sync.get("row_count") or 0
             last_value = last_key_value
-            
+            # one O(columns) scan up front, not one per row
+            pk_index = columns.index(pk_column)
+
+            # the UPSERT is prepared server-side once per table so PG
+            # parses and plans it a single time instead of once per batch
+            exec_query = None
+            if has_pk_index:
+                placeholders = sql.SQL(", ").join(
+                    sql.SQL(f"${i}") for i in range(1, len(columns) + 1))
+                pg_cursor.execute(sql.SQL(
+                    "PREPARE {prep} AS INSERT INTO {tbl} ({cols}) VALUES ({ph}) "
+                    "ON CONFLICT ({pk}) DO UPDATE SET {sets}"
+                ).format(
+                    prep=sql.Identifier(prep_name),
+                    tbl=target, cols=pg_cols, ph=placeholders, pk=pk_ident,
+                    sets=sql.SQL(", ").join(
+                        sql.SQL("{col} = EXCLUDED.{col}").format(col=sql.Identifier(col))
+                        for col in columns if col != pk_column
+                    )
+                ))
+                prepared = True
+                exec_query = f'EXECUTE "{prep_name}" ({", ".join(["%s"] * len(columns))})'
+
             while True:
-                batch = oe_cursor.fetchmany(self.batch_size)
+                oe_cursor.execute(page_query, (last_value,))
+                if converters is None:
+                    self._tune_oe_cursor(oe_cursor)
+                    converters = self._build_converters(oe_cursor.description)
+                batch = oe_cursor.fetchall()
                 if not batch:
                     break
-                    
-                batch_rows = []
+
+                # Save last PK value for tracking
                 for row in batch:
-                    # Save last PK value for tracking
-                    pk_index = columns.index(pk_column)
                     if row[pk_index] is not None:
                         last_value = str(row[pk_index])
-                    
-                    processed_row = []
-                    for value in row:
-                        if value is None:
-                            processed_row.append(None)
-                        elif hasattr(value, 'isoformat'):  # Date objects
-                            processed_row.append(value.isoformat())
-                        else:
-                            processed_row.append(str(value))
-                    
-                    batch_rows.append(processed_row)
-                
+
+                # per-column converters replace the old per-cell
+                # None/hasattr/str probing, same as the full-sync path
+                batch_rows = [self._process_row(row, converters) for row in batch]
+
                 if batch_rows:
-                    upsert_query = f"""
-                    INSERT INTO analytics.{table_name} 
-                    ({', '.join(f'"{col}"' for col in columns)})
-                    VALUES %s
-                    ON CONFLICT ("{pk_column}") DO UPDATE SET
-                    {', '.join(f'"{col}" = EXCLUDED."{col}"' for col in columns if col != pk_column)}
-                    """
-                    try:
-                        execute_values(pg_cursor, upsert_query, batch_rows)
+                    # decided once per table by _ensure_pk_index: with a
+                    # unique index the UPSERT just works, and genuine
+                    # data errors propagate instead of being masked by a
+                    # per-batch fallback
+                    if has_pk_index:
+                        # one round trip: execute_batch joins the whole
+                        # page of EXECUTEs into a single statement string
+                        execute_batch(pg_cursor, exec_query, batch_rows,
+                                      page_size=len(batch_rows))
                         self.pg_conn.commit()
-                    except Exception as e:
-                        # If UPSERT fails (no unique constraint), fall back to delete-then-insert
-                        self.pg_conn.rollback()
-                        self.logger.warning(f"UPSERT failed for {table_name}, using delete-then-insert: {e}")
-                        
-                        pk_values = [row[pk_index] for row in batch]
-                        placeholders = ','.join(['%s'] * len(pk_values))
-                        pg_cursor.execute(f"""
-                        DELETE FROM analytics.{table_name} 
-                        WHERE "{pk_column}" IN ({placeholders})
-                        """, pk_values)
-                        
-                        insert_query = f"""
-                        INSERT INTO analytics.{table_name} 
-                        ({', '.join(f'"{col}"' for col in columns)})
-                        VALUES %s
-                        """
-                        execute_values(pg_cursor, insert_query, batch_rows)
+                    else:
+                        if not staging_created:
+                            pg_cursor.execute(sql.SQL(
+                                "CREATE TEMP TABLE {stg} (LIKE {tbl} INCLUDING DEFAULTS) "
+                                "ON COMMIT DELETE ROWS"
+                            ).format(stg=staging, tbl=target))
+                            staging_created = True
+
+                        self._copy_batch(pg_cursor, staging_copy_query, batch, converters)
+                        pg_cursor.execute(sql.SQL(
+                            "DELETE FROM {tbl} AS tgt USING {stg} AS stg "
+                            "WHERE tgt.{pk} = stg.{pk}"
+                        ).format(tbl=target, stg=staging, pk=pk_ident))
+                        pg_cursor.execute(sql.SQL(
+                            "INSERT INTO {tbl} ({cols}) SELECT {cols} FROM {stg}"
+                        ).format(tbl=target, cols=pg_cols, stg=staging))
+                        # ON COMMIT DELETE ROWS empties the staging table
                         self.pg_conn.commit()
                     
                     rows_synced += len(batch_rows)
-                    
-                    progress_pct = (rows_synced / total_new_rows * 100) if total_new_rows > 0 else 0
-                    existing_rows = last_sync.get("row_count", 0)
-                    
-                    self.logger.info(f"Synced {len(batch_rows)} rows for {table_name} "
-                                f"(total: {rows_synced} of {total_new_rows} ({progress_pct:.1f}%) - "
-                                f"table total will be {existing_rows + rows_synced})")
-            
+                    batch_count += 1
+
+                    # checkpoint the watermark after the data is
+                    # committed, so a crash replays at most
+                    # checkpoint_every pages instead of the whole table
+                    if self.checkpoint_every > 0 and batch_count % self.checkpoint_every == 0:
+                        self.sync_state.update_sync_state(
+                            table_name,
+                            last_key_value=last_value,
+                            sync_method="key_based",
+                            row_count=rows_synced + prior_rows
+                        )
+
+                    if self.log_every > 0 and batch_count % self.log_every == 0:
+                        self.logger.info("Synced %d rows for %s (total: %d rows so far)",
+                                    len(batch_rows), table_name, rows_synced)
+
             if rows_synced > 0 or last_value != last_key_value:
                 self.sync_state.update_sync_state(
-                    table_name, 
+                    table_name,
                     last_key_value=last_value,
-                    sync_method="key_based", 
-                    row_count=rows_synced + (last_sync.get("row_count") or 0)
+                    sync_method="key_based",
+                    row_count=rows_synced + prior_rows
                 )
             
             self.logger.info(f"Completed key-based sync of {table_name}: {rows_synced} new/changed rows")
@@ -549,8 +1071,28 @@ class DataSyncManager:
         except Exception as e:
             self.pg_conn.rollback()
             self.logger.error(f"Error performing key-based sync of {table_name}: {e}")
+            self._ignore_if_permission_error(table_name, e)
             return 0
         finally:
+            if prepared and pg_cursor:
+                # the connection goes back to the pool, so the prepared
+                # statement must not outlive this table's sync
+                try:
+                    self.pg_conn.rollback()
+                    pg_cursor.execute(sql.SQL("DEALLOCATE {prep}").format(
+                        prep=sql.Identifier(prep_name)))
+                    self.pg_conn.commit()
+                except Exception:
+                    pass
+            if staging_created and pg_cursor:
+                # don't leak the temp table into the pooled session
+                try:
+                    self.pg_conn.rollback()
+                    pg_cursor.execute(sql.SQL("DROP TABLE IF EXISTS {stg}").format(
+                        stg=sql.Identifier(staging_table)))
+                    self.pg_conn.commit()
+                except Exception:
+                    pass
             if oe_cursor:
                 oe_cursor.close()
             if pg_cursor:
@@ -560,6 +1102,15 @@ class DataSyncManager:
         # To do - parse tables for date, time, timestamp, or timestamp + tz data and use that to key updates
         return self.sync_full_table(table_info)
 
+    def _sync_table_worker(self, table_info: Dict) -> int:
+        # check a connection out of the pool for this table; the shared
+        # OpenEdge connection hands out a separate statement per cursor
+        self._checkout_pg_conn()
+        try:
+            return self.sync_table(table_info)
+        finally:
+            self._release_pg_conn()
+
     def sync_table(self, table_info: Dict) -> int:
         table_name = table_info["table_name"]
         
@@ -571,6 +1122,8 @@ class DataSyncManager:
         self.logger.info(f"Using {strategy} sync strategy for {table_name}")
         
         rows_synced = 0
+        if strategy == "skip":
+            return 0
         if strategy == "full":
             rows_synced = self.sync_full_table(table_info)
         elif strategy == "key_based":
@@ -591,6 +1144,8 @@ class DataSyncManager:
                 self.logger.error("Failed to connect to databases")
                 return
             
+            self.load_source_row_estimates()
+
             tables = self.get_source_tables()
             if not tables:
                 self.logger.error("No tables found to sync")
@@ -598,19 +1153,33 @@ class DataSyncManager:
                 
             self.logger.info(f"Found {len(tables)} tables to sync")
             
-            for i, table_info in enumerate(tables, 1):
-                table_name = table_info["table_name"]
-                self.logger.info(f"Processing table {i}/{len(tables)}: {table_name}")
-                
-                try:
-                    rows = self.sync_table(table_info)
-                    
-                    # Update metrics
-                    self.metrics["tables_processed"] += 1
-                    self.metrics["rows_synced"] += rows
-                    
-                except Exception as e:
-                    self.logger.error(f"Error syncing table {table_name}: {e}")
+            if self.max_workers > 1:
+                self.logger.info(f"Syncing with {self.max_workers} worker threads")
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {executor.submit(self._sync_table_worker, table_info): table_info["table_name"]
+                               for table_info in tables}
+                    for future in as_completed(futures):
+                        table_name = futures[future]
+                        try:
+                            rows = future.result()
+                            self.metrics["tables_processed"] += 1
+                            self.metrics["rows_synced"] += rows
+                        except Exception as e:
+                            self.logger.error(f"Error syncing table {table_name}: {e}")
+            else:
+                for i, table_info in enumerate(tables, 1):
+                    table_name = table_info["table_name"]
+                    self.logger.info(f"Processing table {i}/{len(tables)}: {table_name}")
+
+                    try:
+                        rows = self.sync_table(table_info)
+
+                        # Update metrics
+                        self.metrics["tables_processed"] += 1
+                        self.metrics["rows_synced"] += rows
+
+                    except Exception as e:
+                        self.logger.error(f"Error syncing table {table_name}: {e}")
             
             duration = time.time() - start_time
             self.logger.info(f"Sync completed in {duration:.2f} seconds")
@@ -620,16 +1189,83 @@ class DataSyncManager:
         except Exception as e:
             self.logger.error(f"Sync process failed: {e}")
         finally:
+            self.flush_ignore_list()
             self.disconnect_databases()
 
+        return self.metrics
+
+def _sync_table_group(table_names, full_sync, ignore_tables, verify_counts):
+    # runs in a worker process with its own JVM and PG pool
+    syncer = DataSyncManager(full_sync=full_sync, ignore_tables=ignore_tables,
+                             verify_counts=verify_counts, only_tables=set(table_names))
+    return syncer.run_sync()
+
+def run_parallel_sync(workers: int, full_sync: bool, ignore_tables: list, verify_counts: bool):
+    # discover the table list once, then partition it across processes;
+    # each worker mirrors its share with independent connections
+    discoverer = DataSyncManager(full_sync=full_sync, ignore_tables=ignore_tables,
+                                 verify_counts=verify_counts)
+    logger = logging.getLogger("data_import")
+
+    if not discoverer.connect_databases():
+        logger.error("Failed to connect to databases")
+        return
+    try:
+        tables = discoverer.get_source_tables()
+    finally:
+        discoverer.disconnect_databases()
+
+    if not tables:
+        logger.error("No tables found to sync")
+        return
+
+    table_names = [table_info["table_name"] for table_info in tables]
+    groups = [table_names[i::workers] for i in range(workers)]
+    groups = [group for group in groups if group]
+
+    logger.info(f"Syncing {len(table_names)} tables across {len(groups)} worker processes")
+
+    start_time = time.time()
+    tables_processed = 0
+    rows_synced = 0
+
+    # spawn, not fork: the parent's JVM does not survive a fork
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(groups), mp_context=mp_context) as executor:
+        futures = [executor.submit(_sync_table_group, group, full_sync, ignore_tables, verify_counts)
+                   for group in groups]
+        for future in futures:
+            try:
+                metrics = future.result()
+                if metrics:
+                    tables_processed += metrics["tables_processed"]
+                    rows_synced += metrics["rows_synced"]
+            except Exception as e:
+                logger.error(f"Worker process failed: {e}")
+
+    duration = time.time() - start_time
+    logger.info(f"Parallel sync completed in {duration:.2f} seconds")
+    logger.info(f"Processed {tables_processed} tables")
+    logger.info(f"Synced {rows_synced} rows")
+
 def main():
     parser = argparse.ArgumentParser(description="Sync data from OpenEdge to PostgreSQL")
     parser.add_argument("--full-sync", action="store_true", help="Perform full sync of all tables")
     parser.add_argument("--ignore-table", action="append", help="Tables to ignore")
+    parser.add_argument("--verify-counts", action="store_true",
+                        help="Run COUNT(*) on source tables for exact progress totals")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Sync tables across N worker processes (default 1: "
+                             "max_workers threads already run per process, and "
+                             "each extra process starts its own JVM)")
     args = parser.parse_args()
-    
-    syncer = DataSyncManager(full_sync=args.full_sync, ignore_tables=args.ignore_table)
-    syncer.run_sync()
+
+    if args.parallel > 1:
+        run_parallel_sync(args.parallel, args.full_sync, args.ignore_table, args.verify_counts)
+    else:
+        syncer = DataSyncManager(full_sync=args.full_sync, ignore_tables=args.ignore_table,
+                                 verify_counts=args.verify_counts)
+        syncer.run_sync()
 
 if __name__ == "__main__":
     main()